@@ -10,39 +10,18 @@ This script creates test projects with different Python dependency management to
 for manual testing of the python-sbom-action.
 """
 
+import os
 import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# --- Templates ---
 
-def create_test_project(name: str, tool: str, base_dir: Path = Path("test-projects")):
-    """Create a test project for the specified tool."""
-    project_dir = base_dir / name
-    project_dir.mkdir(parents=True, exist_ok=True)
-
-    print(f"Creating {tool} test project: {project_dir}")
-
-    if tool == "uv":
-        create_uv_project(project_dir)
-    elif tool == "pdm":
-        create_pdm_project(project_dir)
-    elif tool == "poetry":
-        create_poetry_project(project_dir)
-    elif tool == "pipenv":
-        create_pipenv_project(project_dir)
-    elif tool == "pip":
-        create_pip_project(project_dir)
-    elif tool == "pip-tools":
-        create_pip_tools_project(project_dir)
-    else:
-        print(f"Unknown tool: {tool}")
-        return False
-
-    return True
+# Interpreter version recorded in the simulated pip-compile header
+_PY_MAJOR, _PY_MINOR = sys.version_info[:2]
 
-
-def create_uv_project(project_dir: Path):
-    """Create a uv-based test project."""
-    pyproject_content = """[project]
+UV_PYPROJECT_TOML = """[project]
 name = "test-uv-project"
 version = "0.1.0"
 description = "Test project for uv SBOM generation"
@@ -67,12 +46,7 @@ requires = ["hatchling"]
 build-backend = "hatchling.build"
 """
 
-    with open(project_dir / "pyproject.toml", "w") as f:
-        f.write(pyproject_content)
-
-    # Create a simple Python file
-    with open(project_dir / "main.py", "w") as f:
-        f.write("""import requests
+UV_MAIN_PY = """import requests
 import click
 
 @click.command()
@@ -83,15 +57,9 @@ def hello():
 
 if __name__ == '__main__':
     hello()
-""")
-
-    print("  ✓ Created pyproject.toml and main.py")
-    print("  → Run 'uv lock' in the project directory to create uv.lock")
-
+"""
 
-def create_pdm_project(project_dir: Path):
-    """Create a PDM-based test project."""
-    pyproject_content = """[project]
+PDM_PYPROJECT_TOML = """[project]
 name = "test-pdm-project"
 version = "0.1.0"
 description = "Test project for PDM SBOM generation"
@@ -121,11 +89,7 @@ lint = [
 ]
 """
 
-    with open(project_dir / "pyproject.toml", "w") as f:
-        f.write(pyproject_content)
-
-    with open(project_dir / "app.py", "w") as f:
-        f.write("""from fastapi import FastAPI
+PDM_APP_PY = """from fastapi import FastAPI
 import requests
 
 app = FastAPI()
@@ -138,15 +102,9 @@ async def root():
 async def fetch_data():
     response = requests.get("https://httpbin.org/json")
     return {"status": response.status_code, "data": response.json()}
-""")
-
-    print("  ✓ Created pyproject.toml and app.py")
-    print("  → Run 'pdm lock' in the project directory to create pdm.lock")
-
+"""
 
-def create_poetry_project(project_dir: Path):
-    """Create a Poetry-based test project."""
-    pyproject_content = """[tool.poetry]
+POETRY_PYPROJECT_TOML = """[tool.poetry]
 name = "test-poetry-project"
 version = "0.1.0"
 description = "Test project for Poetry SBOM generation"
@@ -174,14 +132,9 @@ requires = ["poetry-core"]
 build-backend = "poetry.core.masonry.api"
 """
 
-    with open(project_dir / "pyproject.toml", "w") as f:
-        f.write(pyproject_content)
-
-    with open(project_dir / "README.md", "w") as f:
-        f.write("# Test Poetry Project\n\nTest project for Poetry SBOM generation.\n")
+POETRY_README_MD = "# Test Poetry Project\n\nTest project for Poetry SBOM generation.\n"
 
-    with open(project_dir / "manage.py", "w") as f:
-        f.write("""#!/usr/bin/env python
+POETRY_MANAGE_PY = """#!/usr/bin/env python
 import os
 import sys
 import requests
@@ -201,15 +154,9 @@ def main():
 
 if __name__ == '__main__':
     main()
-""")
-
-    print("  ✓ Created pyproject.toml, README.md, and manage.py")
-    print("  → Run 'poetry lock' in the project directory to create poetry.lock")
-
+"""
 
-def create_pipenv_project(project_dir: Path):
-    """Create a Pipenv-based test project."""
-    pipfile_content = """[[source]]
+PIPENV_PIPFILE = """[[source]]
 url = "https://pypi.org/simple"
 verify_ssl = true
 name = "pypi"
@@ -234,11 +181,7 @@ dev = "python app.py"
 test = "pytest"
 """
 
-    with open(project_dir / "Pipfile", "w") as f:
-        f.write(pipfile_content)
-
-    with open(project_dir / "app.py", "w") as f:
-        f.write("""from flask import Flask, jsonify
+PIPENV_APP_PY = """from flask import Flask, jsonify
 import requests
 import redis
 
@@ -264,15 +207,9 @@ def get_cache(key):
 
 if __name__ == '__main__':
     app.run(debug=True)
-""")
-
-    print("  ✓ Created Pipfile and app.py")
-    print("  → Run 'pipenv lock' in the project directory to create Pipfile.lock")
-
+"""
 
-def create_pip_project(project_dir: Path):
-    """Create a pip-based test project."""
-    requirements_content = """requests>=2.31.0
+PIP_REQUIREMENTS_TXT = """requests>=2.31.0
 flask>=2.3.0
 jinja2>=3.1.0
 werkzeug>=2.3.0
@@ -286,7 +223,7 @@ charset-normalizer>=3.3.0
 idna>=3.6
 """
 
-    requirements_dev_content = """pytest>=7.4.0
+PIP_REQUIREMENTS_DEV_TXT = """pytest>=7.4.0
 pytest-flask>=1.3.0
 coverage>=7.3.0
 black>=23.12.0
@@ -294,14 +231,7 @@ flake8>=6.1.0
 mypy>=1.8.0
 """
 
-    with open(project_dir / "requirements.txt", "w") as f:
-        f.write(requirements_content)
-
-    with open(project_dir / "requirements-dev.txt", "w") as f:
-        f.write(requirements_dev_content)
-
-    with open(project_dir / "setup.py", "w") as f:
-        f.write("""from setuptools import setup, find_packages
+PIP_SETUP_PY = """from setuptools import setup, find_packages
 
 setup(
     name="test-pip-project",
@@ -316,10 +246,9 @@ setup(
     ],
     python_requires=">=3.8",
 )
-""")
+"""
 
-    with open(project_dir / "server.py", "w") as f:
-        f.write("""from flask import Flask, request, jsonify
+PIP_SERVER_PY = """from flask import Flask, request, jsonify
 import requests
 
 app = Flask(__name__)
@@ -343,14 +272,9 @@ def proxy():
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
-""")
-
-    print("  ✓ Created requirements.txt, requirements-dev.txt, setup.py, and server.py")
-
+"""
 
-def create_pip_tools_project(project_dir: Path):
-    """Create a pip-tools-based test project."""
-    requirements_in_content = """# Production dependencies
+PIP_TOOLS_REQUIREMENTS_IN = """# Production dependencies
 requests>=2.25.0
 fastapi>=0.100.0
 uvicorn[standard]>=0.20.0
@@ -359,7 +283,7 @@ sqlalchemy>=2.0.0
 alembic>=1.12.0
 """
 
-    requirements_dev_in_content = """# Development dependencies
+PIP_TOOLS_REQUIREMENTS_DEV_IN = """# Development dependencies
 -r requirements.in
 pytest>=7.0.0
 pytest-asyncio>=0.21.0
@@ -370,8 +294,8 @@ mypy>=1.5.0
 pre-commit>=3.0.0
 """
 
-    # Generate locked requirements (simulated)
-    requirements_txt_content = f"""# This file is autogenerated by pip-compile with Python {sys.version_info.major}.{sys.version_info.minor}
+# Simulated pip-compile output
+PIP_TOOLS_REQUIREMENTS_TXT = f"""# This file is autogenerated by pip-compile with Python {_PY_MAJOR}.{_PY_MINOR}
 # To update, run:
 #
 #    pip-compile requirements.in
@@ -457,17 +381,7 @@ websockets==12.0
     # via uvicorn
 """
 
-    with open(project_dir / "requirements.in", "w") as f:
-        f.write(requirements_in_content)
-
-    with open(project_dir / "requirements-dev.in", "w") as f:
-        f.write(requirements_dev_in_content)
-
-    with open(project_dir / "requirements.txt", "w") as f:
-        f.write(requirements_txt_content)
-
-    with open(project_dir / "api.py", "w") as f:
-        f.write("""from fastapi import FastAPI, HTTPException
+PIP_TOOLS_API_PY = """from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 import requests
 import uvicorn
@@ -506,12 +420,150 @@ async def proxy_request(request: ProxyRequest):
 
 if __name__ == "__main__":
     uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=True)
-""")
+"""
+
+
+def _emit(msgs: list[str]) -> None:
+    """Write a project's buffered output lines to stdout in a single call."""
+    sys.stdout.write("\n".join(msgs) + "\n")
+
 
-    print(
-        "  ✓ Created requirements.in, requirements-dev.in, requirements.txt, and api.py"
+def _write(path: Path, data: str) -> None:
+    """Write UTF-8 text to a file using unbuffered file descriptor I/O."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data.encode("utf-8"))
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _write_files(project_dir: Path, files: tuple[tuple[str, str], ...]) -> None:
+    """Write each (name, template) pair into the project directory."""
+    for name, body in files:
+        _write(project_dir / name, body)
+
+
+def create_test_project(
+    name: str, tool: str, base_dir: Path = Path("test-projects")
+) -> tuple[bool, list[str]]:
+    """Create a test project for the specified tool.
+
+    Returns whether the project was created and its output lines.
+    """
+    project_dir = base_dir / name
+    project_dir.mkdir(parents=True, exist_ok=True)
+
+    msgs = [f"Creating {tool} test project: {project_dir}"]
+
+    creator = _CREATORS.get(tool)
+    if creator is None:
+        msgs.extend((f"Unknown tool: {tool}", ""))
+        return False, msgs
+
+    msgs.extend(creator(project_dir))
+    msgs.append("")
+    return True, msgs
+
+
+def create_uv_project(project_dir: Path) -> list[str]:
+    """Create a uv-based test project."""
+    files = (
+        ("pyproject.toml", UV_PYPROJECT_TOML),
+        ("main.py", UV_MAIN_PY),
+    )
+    _write_files(project_dir, files)
+
+    return [
+        "  ✓ Created pyproject.toml and main.py",
+        "  → Run 'uv lock' in the project directory to create uv.lock",
+    ]
+
+
+def create_pdm_project(project_dir: Path) -> list[str]:
+    """Create a PDM-based test project."""
+    files = (
+        ("pyproject.toml", PDM_PYPROJECT_TOML),
+        ("app.py", PDM_APP_PY),
+    )
+    _write_files(project_dir, files)
+
+    return [
+        "  ✓ Created pyproject.toml and app.py",
+        "  → Run 'pdm lock' in the project directory to create pdm.lock",
+    ]
+
+
+def create_poetry_project(project_dir: Path) -> list[str]:
+    """Create a Poetry-based test project."""
+    files = (
+        ("pyproject.toml", POETRY_PYPROJECT_TOML),
+        ("README.md", POETRY_README_MD),
+        ("manage.py", POETRY_MANAGE_PY),
     )
-    print("  → This project uses pip-tools (requirements.txt with hashes/pins)")
+    _write_files(project_dir, files)
+
+    return [
+        "  ✓ Created pyproject.toml, README.md, and manage.py",
+        "  → Run 'poetry lock' in the project directory to create poetry.lock",
+    ]
+
+
+def create_pipenv_project(project_dir: Path) -> list[str]:
+    """Create a Pipenv-based test project."""
+    files = (
+        ("Pipfile", PIPENV_PIPFILE),
+        ("app.py", PIPENV_APP_PY),
+    )
+    _write_files(project_dir, files)
+
+    return [
+        "  ✓ Created Pipfile and app.py",
+        "  → Run 'pipenv lock' in the project directory to create Pipfile.lock",
+    ]
+
+
+def create_pip_project(project_dir: Path) -> list[str]:
+    """Create a pip-based test project."""
+    files = (
+        ("requirements.txt", PIP_REQUIREMENTS_TXT),
+        ("requirements-dev.txt", PIP_REQUIREMENTS_DEV_TXT),
+        ("setup.py", PIP_SETUP_PY),
+        ("server.py", PIP_SERVER_PY),
+    )
+    _write_files(project_dir, files)
+
+    return [
+        "  ✓ Created requirements.txt, requirements-dev.txt, setup.py, and server.py",
+    ]
+
+
+def create_pip_tools_project(project_dir: Path) -> list[str]:
+    """Create a pip-tools-based test project."""
+    files = (
+        ("requirements.in", PIP_TOOLS_REQUIREMENTS_IN),
+        ("requirements-dev.in", PIP_TOOLS_REQUIREMENTS_DEV_IN),
+        ("requirements.txt", PIP_TOOLS_REQUIREMENTS_TXT),
+        ("api.py", PIP_TOOLS_API_PY),
+    )
+    _write_files(project_dir, files)
+
+    return [
+        "  ✓ Created requirements.in, requirements-dev.in, requirements.txt, and api.py",
+        "  → This project uses pip-tools (requirements.txt with hashes/pins)",
+    ]
+
+
+# Map each supported tool name to the function that creates its project
+_CREATORS: dict[str, Callable[[Path], list[str]]] = {
+    "uv": create_uv_project,
+    "pdm": create_pdm_project,
+    "poetry": create_poetry_project,
+    "pipenv": create_pipenv_project,
+    "pip": create_pip_project,
+    "pip-tools": create_pip_tools_project,
+}
 
 
 def main():
@@ -529,11 +581,17 @@ def main():
     print()
 
     success_count = 0
-    for tool in tools:
-        project_name = f"test-{tool}-project"
-        if create_test_project(project_name, tool, base_dir):
-            success_count += 1
-        print()
+    with ThreadPoolExecutor(max_workers=min(8, len(tools))) as executor:
+        futures = [
+            executor.submit(create_test_project, f"test-{tool}-project", tool, base_dir)
+            for tool in tools
+        ]
+        # Report in command-line order regardless of completion order
+        for future in futures:
+            created, msgs = future.result()
+            _emit(msgs)
+            if created:
+                success_count += 1
 
     print(f"✅ Successfully created {success_count}/{len(tools)} test projects")
 